@@ -1,11 +1,50 @@
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 import os
-from openpyxl import Workbook
+import json
+import re
+from zipfile import BadZipFile
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.utils.datetime import to_excel
+from openpyxl.utils.exceptions import InvalidFileException
 import calendar
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Iterator
+
+
+# Shared cell styles, built once so every calendar cell references the same objects.
+_WEEKEND_FILL = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
+_WORKDAY_FILL = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_EXTRA_FILL = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
+_TOTAL_WORKED_FILL = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+_TOTAL_EXTRA_FILL = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_BOLD_FONT = Font(bold=True)
+_HEADER_FONT = Font(color="FFFFFF", bold=True)
+_TITLE_FONT = Font(size=16, bold=True)
+_CENTER_ALIGN = Alignment(horizontal='center')
+
+# Calendar fill by 1-based column: Monday-Friday are workdays, Saturday-Sunday weekends.
+_COL_FILL = (
+    None,
+    _WORKDAY_FILL, _WORKDAY_FILL, _WORKDAY_FILL, _WORKDAY_FILL, _WORKDAY_FILL,
+    _WEEKEND_FILL, _WEEKEND_FILL
+)
+_CALENDAR_COLUMN_LETTERS = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+
+
+def _format_hours(time_delta: timedelta) -> str:
+    """Convert timedelta to HH:MM format."""
+    total_seconds = int(time_delta.total_seconds())
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    return f"{hours:02d}:{minutes:02d}"
 
 
 class WorkHoursTracker:
@@ -64,27 +103,32 @@ class WorkHoursTracker:
         while True:
             date_input = input("Enter date (YYYY-MM-DD format, example: 2025-01-15): ").strip()
             
-            if self._is_valid_date(date_input):
-                return date_input
+            normalized_date = self._normalize_date(date_input)
+            if normalized_date is not None:
+                return normalized_date
             
             print("⚠️ Invalid date format. Please use YYYY-MM-DD (example: 2025-01-15)")
     
-    def _is_valid_date(self, date_string: str) -> bool:
-        """Validate date format and ensure it's not in the future."""
+    def _normalize_date(self, date_string: str) -> Optional[str]:
+        """Validate a YYYY-MM-DD date that is not in the future and return it normalized, or None."""
+        # fromisoformat accepts other ISO forms on newer Pythons, so enforce the exact shape first.
+        if not re.fullmatch(r"[0-9]{4}-[0-9]{2}-[0-9]{2}", date_string):
+            return None
+        
         try:
-            date_object = datetime.strptime(date_string, "%Y-%m-%d")
-            
-            if date_object > datetime.today():
-                print("⚠ Cannot enter hours for future dates. Please select today or a past date.")
-                return False
-                
-            return True
+            date_object = date.fromisoformat(date_string)
         except ValueError:
-            return False
+            return None
+        
+        if date_object > date.today():
+            print("⚠ Cannot enter hours for future dates. Please select today or a past date.")
+            return None
+        
+        return date_object.isoformat()
     
     def _collect_time_entries(self) -> List[List[str]]:
         """Collect time entries from user input."""
-        date_object = datetime.strptime(self.selected_date, "%Y-%m-%d")
+        date_object = date.fromisoformat(self.selected_date)
         day_name = date_object.strftime("%A")
         
         print(f"\n📅 Selected date: {self.selected_date} ({day_name})")
@@ -111,11 +155,11 @@ class WorkHoursTracker:
     
     def _is_valid_time_format(self, time_string: str) -> bool:
         """Validate time format HH.MM."""
-        try:
-            datetime.strptime(time_string, "%H.%M")
-            return True
-        except ValueError:
-            return False
+        hours, _, minutes = time_string.partition(".")
+        return (
+            hours.isdecimal() and minutes.isdecimal()
+            and 0 <= int(hours) < 24 and 0 <= int(minutes) < 60
+        )
     
     def _determine_entry_type(self, entry_count: int) -> str:
         """Determine if entry is clock in or clock out."""
@@ -123,30 +167,23 @@ class WorkHoursTracker:
     
     def _calculate_hours(self) -> Tuple[timedelta, timedelta]:
         """Calculate total worked hours and extra hours."""
-        time_dataframe = self._create_time_dataframe()
-        total_worked = self._calculate_total_worked_time(time_dataframe)
+        total_worked = self._calculate_total_worked_time()
         extra_hours = total_worked - timedelta(hours=self.STANDARD_WORKDAY_HOURS)
         
         return total_worked, extra_hours
     
-    def _create_time_dataframe(self) -> pd.DataFrame:
-        """Create DataFrame from time entries."""
-        dataframe = pd.DataFrame(self.time_entries, columns=["Date", "Type", "Time"])
-        dataframe["DateTime"] = pd.to_datetime(
-            dataframe["Date"] + " " + dataframe["Time"], 
-            format="%Y-%m-%d %H.%M"
-        )
-        return dataframe
-    
-    def _calculate_total_worked_time(self, time_dataframe: pd.DataFrame) -> timedelta:
+    def _calculate_total_worked_time(self) -> timedelta:
         """Calculate total worked time from clock in/out pairs."""
         total_worked = timedelta()
+        entries = self.time_entries
         
-        for i in range(0, len(time_dataframe), 2):
-            if i + 1 < len(time_dataframe):
-                clock_in_time = time_dataframe.loc[i, "DateTime"]
-                clock_out_time = time_dataframe.loc[i + 1, "DateTime"]
-                total_worked += clock_out_time - clock_in_time
+        for i in range(0, len(entries) - 1, 2):
+            clock_in_hours, clock_in_minutes = entries[i][2].split(".")
+            clock_out_hours, clock_out_minutes = entries[i + 1][2].split(".")
+            total_worked += timedelta(
+                hours=int(clock_out_hours) - int(clock_in_hours),
+                minutes=int(clock_out_minutes) - int(clock_in_minutes)
+            )
         
         return total_worked
     
@@ -158,10 +195,7 @@ class WorkHoursTracker:
     
     def _format_timedelta(self, time_delta: timedelta) -> str:
         """Convert timedelta to readable HH:MM format."""
-        total_seconds = int(time_delta.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        return f"{hours:02d}:{minutes:02d}"
+        return _format_hours(time_delta)
     
     def _save_to_excel(self, worked_hours: timedelta, extra_hours: timedelta):
         """Save work hours data to Excel calendar format."""
@@ -169,12 +203,17 @@ class WorkHoursTracker:
         extra_hours_string = self._format_timedelta(extra_hours)
         
         excel_generator = ExcelCalendarGenerator()
-        excel_generator.create_calendar_excel(
-            self.EXCEL_FILENAME, 
-            self.selected_date, 
-            worked_hours_string, 
-            extra_hours_string
-        )
+        try:
+            excel_generator.create_calendar_excel(
+                self.EXCEL_FILENAME, 
+                self.selected_date, 
+                worked_hours_string, 
+                extra_hours_string
+            )
+        except ValueError as error:
+            print(f"\n⚠️ Could not import existing history: {error}")
+            print(f"Nothing was saved. Fix or move '{self.EXCEL_FILENAME}' and try again.")
+            return
         
         print(f"\n✅ Data saved to '{self.EXCEL_FILENAME}' in calendar format.")
 
@@ -182,208 +221,294 @@ class WorkHoursTracker:
 class ExcelCalendarGenerator:
     """Handles Excel calendar creation and formatting."""
     
-    def create_calendar_excel(self, file_path: str, date: str, worked_hours: str, extra_hours: str):
+    SAVE_BUFFER_SIZE = 1 << 20
+    
+    def create_calendar_excel(self, file_path: str, date_string: str, worked_hours: str, extra_hours: str):
         """Create Excel file with calendar format."""
-        work_data = self._load_existing_data(file_path)
-        work_data = self._add_current_day_data(work_data, date, worked_hours, extra_hours)
+        # The JSON history is the authoritative record; the workbook is rebuilt from it every run.
+        store_path = self._get_store_path(file_path)
+        work_data = self._load_existing_data(store_path, file_path)
+        work_data = self._add_current_day_data(work_data, date_string, worked_hours, extra_hours)
+        all_records = self._flatten_work_data(work_data)
+        self._save_store(store_path, all_records)
         
         workbook = self._create_workbook_with_calendars(work_data)
-        self._add_backup_data_sheet(workbook, work_data)
-        workbook.save(file_path)
+        self._add_backup_data_sheet(workbook, all_records)
+        
+        # A large buffer turns the zip writer's many small writes into a few big ones.
+        with open(file_path, "wb", buffering=self.SAVE_BUFFER_SIZE) as excel_file:
+            workbook.save(excel_file)
+    
+    def _get_store_path(self, file_path: str) -> str:
+        """Get the JSON history path that sits alongside the Excel file."""
+        return os.path.splitext(file_path)[0] + ".json"
     
-    def _load_existing_data(self, file_path: str) -> Dict[str, Dict[str, Dict[str, str]]]:
-        """Load existing work data from Excel file."""
+    def _load_existing_data(self, store_path: str, file_path: str) -> Dict[Tuple[int, int], Dict[int, dict]]:
+        """Load existing work data, migrating from the Excel file if no JSON history exists yet."""
+        if os.path.exists(store_path):
+            return self._load_from_store(store_path)
+        
         if not os.path.exists(file_path):
             return {}
         
+        # Nothing is saved if this import fails, so a bad workbook never replaces the history.
         try:
-            return self._load_from_data_sheet(file_path)
-        except:
+            return self._load_from_workbook(file_path)
+        except (InvalidFileException, BadZipFile) as error:
+            raise ValueError(f"'{file_path}' is not a readable Excel file") from error
+    
+    def _load_from_store(self, store_path: str) -> Dict[Tuple[int, int], Dict[int, dict]]:
+        """Load data from the JSON history keyed by YYYY-MM-DD, grouped by month and day of month."""
+        with open(store_path, encoding="utf-8") as store_file:
+            records = json.load(store_file)
+        
+        work_data = {}
+        for date_string, hours in records.items():
+            month_key = (int(date_string[:4]), int(date_string[5:7]))
+            work_data.setdefault(month_key, {})[int(date_string[8:10])] = self._create_day_record(
+                hours['worked_hours'], hours['extra_hours']
+            )
+        
+        return work_data
+    
+    def _save_store(self, store_path: str, all_records: List[List[str]]):
+        """Write all records to the JSON history, replacing the previous file atomically."""
+        records = {
+            date_string: {'worked_hours': worked_hours, 'extra_hours': extra_hours}
+            for date_string, worked_hours, extra_hours in all_records
+        }
+        
+        temporary_path = store_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as store_file:
             try:
-                return self._load_from_legacy_format(file_path)
-            except:
-                return {}
-    
-    def _load_from_data_sheet(self, file_path: str) -> Dict[str, Dict[str, Dict[str, str]]]:
-        """Load data from the Data sheet."""
-        existing_dataframe = pd.read_excel(file_path, sheet_name='Data')
-        return self._convert_dataframe_to_work_data(existing_dataframe)
-    
-    def _load_from_legacy_format(self, file_path: str) -> Dict[str, Dict[str, Dict[str, str]]]:
-        """Load data from legacy Excel format."""
-        old_dataframe = pd.read_excel(file_path)
-        return self._convert_dataframe_to_work_data(old_dataframe)
-    
-    def _convert_dataframe_to_work_data(self, dataframe: pd.DataFrame) -> Dict[str, Dict[str, Dict[str, str]]]:
-        """Convert DataFrame to work data dictionary structure."""
+                json.dump(records, store_file, indent=2, sort_keys=True)
+            except Exception:
+                store_file.close()
+                os.remove(temporary_path)
+                raise
+        os.replace(temporary_path, store_path)
+    
+    def _load_from_workbook(self, file_path: str) -> Dict[Tuple[int, int], Dict[int, dict]]:
+        """Load data from the Data sheet, or from the first sheet of a legacy Excel file."""
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if 'Data' in workbook.sheetnames:
+                worksheet = workbook['Data']
+            else:
+                worksheet = workbook.worksheets[0]
+            return self._convert_rows_to_work_data(
+                worksheet.title, worksheet.iter_rows(values_only=True), workbook.epoch
+            )
+        finally:
+            workbook.close()
+    
+    def _convert_rows_to_work_data(self, sheet_title: str, rows: Iterator[tuple],
+                                   epoch: datetime) -> Dict[Tuple[int, int], Dict[int, dict]]:
+        """Convert worksheet rows, starting with a header row, to work data dictionary structure."""
         work_data = {}
         
-        for _, row in dataframe.iterrows():
-            date_object = self._parse_date_from_row(row['Date'])
-            month_year = date_object.strftime("%Y-%m")
-            date_string = date_object.strftime("%Y-%m-%d")
+        header = next(rows, None)
+        if header is None:
+            return work_data
+        
+        missing_columns = [name for name in ('Date', 'Hours Worked', 'Extra Hours') if name not in header]
+        if missing_columns:
+            raise ValueError(f"sheet '{sheet_title}' is missing columns: {', '.join(missing_columns)}")
+        
+        date_index = header.index('Date')
+        worked_index = header.index('Hours Worked')
+        extra_index = header.index('Extra Hours')
+        
+        for row_number, row in enumerate(rows, start=2):
+            raw_date = row[date_index]
+            if raw_date is None:
+                continue
             
-            if month_year not in work_data:
-                work_data[month_year] = {}
+            date_value = self._parse_date_value(raw_date)
+            if date_value is None:
+                raise ValueError(f"sheet '{sheet_title}' row {row_number} has an invalid date: {raw_date!r}")
             
-            work_data[month_year][date_string] = {
-                'worked_hours': row['Hours Worked'],
-                'extra_hours': row['Extra Hours']
-            }
+            month_key = (date_value.year, date_value.month)
+            work_data.setdefault(month_key, {})[date_value.day] = self._create_day_record(
+                self._format_hours_value(row[worked_index], epoch),
+                self._format_hours_value(row[extra_index], epoch)
+            )
         
         return work_data
     
-    def _parse_date_from_row(self, date_value) -> datetime:
-        """Parse date from Excel row, handling both string and datetime types."""
+    def _parse_date_value(self, date_value) -> Optional[datetime]:
+        """Parse a Date cell, which may be a YYYY-MM-DD string or a datetime; return None if invalid."""
+        if isinstance(date_value, datetime):
+            return date_value
         if isinstance(date_value, str):
-            return datetime.strptime(date_value, "%Y-%m-%d")
-        return date_value
-    
-    def _add_current_day_data(self, work_data: dict, date: str, worked_hours: str, extra_hours: str) -> dict:
+            try:
+                return datetime.fromisoformat(date_value)
+            except ValueError:
+                return None
+        return None
+    
+    def _format_hours_value(self, value, epoch: datetime) -> str:
+        """Convert an hours cell value to HH:MM, since Excel may hold times rather than text."""
+        if value is None:
+            return "00:00"
+        if isinstance(value, (time, timedelta, datetime)):
+            # Durations of 24h or more come back as datetimes; convert all back to Excel days.
+            excel_days = to_excel(value, epoch)
+            return _format_hours(timedelta(minutes=round(excel_days * 24 * 60)))
+        return str(value)
+    
+    def _add_current_day_data(self, work_data: dict, date_string: str, worked_hours: str, extra_hours: str) -> dict:
         """Add today's work data to the existing data."""
-        date_object = datetime.strptime(date, "%Y-%m-%d")
-        month_year = date_object.strftime("%Y-%m")
+        date_object = date.fromisoformat(date_string)
+        month_key = (date_object.year, date_object.month)
         
-        if month_year not in work_data:
-            work_data[month_year] = {}
+        if month_key not in work_data:
+            work_data[month_key] = {}
         
-        work_data[month_year][date] = {
-            'worked_hours': worked_hours,
-            'extra_hours': extra_hours
-        }
+        work_data[month_key][date_object.day] = self._create_day_record(worked_hours, extra_hours)
         
         return work_data
     
+    def _create_day_record(self, worked_hours: str, extra_hours: str) -> dict:
+        """Create a day's work data entry, flagging whether it has extra hours."""
+        return {
+            'worked_hours': worked_hours,
+            'extra_hours': extra_hours,
+            'has_extra': extra_hours != "00:00"
+        }
+    
     def _create_workbook_with_calendars(self, work_data: dict) -> Workbook:
         """Create workbook with calendar sheets for each month."""
-        workbook = Workbook()
-        workbook.remove(workbook.active)
+        workbook = Workbook(write_only=True)
         
-        for month_key in sorted(work_data.keys()):
-            year, month = map(int, month_key.split('-'))
-            sheet_name = f"{calendar.month_name[month]} {year}"
-            worksheet = workbook.create_sheet(title=sheet_name)
+        for year, month in sorted(work_data.keys()):
+            month_title = f"{calendar.month_name[month]} {year}"
+            worksheet = workbook.create_sheet(title=month_title)
             
             calendar_formatter = MonthlyCalendarFormatter()
-            calendar_formatter.create_monthly_calendar(worksheet, year, month, work_data[month_key])
+            calendar_formatter.create_monthly_calendar(worksheet, month_title, year, month, work_data[year, month])
         
         return workbook
     
-    def _add_backup_data_sheet(self, workbook: Workbook, work_data: dict):
+    def _add_backup_data_sheet(self, workbook: Workbook, all_records: List[List[str]]):
         """Add backup data sheet with all records."""
         data_worksheet = workbook.create_sheet(title='Data')
-        all_records = self._flatten_work_data(work_data)
         
         if all_records:
-            backup_dataframe = pd.DataFrame(all_records, columns=['Date', 'Hours Worked', 'Extra Hours'])
-            for row in dataframe_to_rows(backup_dataframe, index=False, header=True):
-                data_worksheet.append(row)
+            data_worksheet.append(['Date', 'Hours Worked', 'Extra Hours'])
+            for record in all_records:
+                data_worksheet.append(record)
     
     def _flatten_work_data(self, work_data: dict) -> List[List[str]]:
         """Flatten work data dictionary to list of records."""
-        all_records = []
-        for month_data in work_data.values():
-            for date, hours in month_data.items():
-                all_records.append([date, hours['worked_hours'], hours['extra_hours']])
-        return all_records
+        return [
+            [f"{year}-{month:02d}-{day:02d}", hours['worked_hours'], hours['extra_hours']]
+            for (year, month), month_data in work_data.items()
+            for day, hours in month_data.items()
+        ]
 
 
 class MonthlyCalendarFormatter:
     """Handles formatting of monthly calendar sheets."""
     
-    def create_monthly_calendar(self, worksheet, year: int, month: int, month_data: dict):
+    def create_monthly_calendar(self, worksheet, month_title: str, year: int, month: int, month_data: dict):
         """Create formatted monthly calendar in worksheet."""
-        self._add_month_title(worksheet, year, month)
-        self._add_day_headers(worksheet)
-        self._fill_calendar_days(worksheet, year, month, month_data)
-        self._add_monthly_totals(worksheet, month_data, len(calendar.monthcalendar(year, month)))
+        calendar_weeks = calendar.monthcalendar(year, month)
+        
+        # Write-only sheets are streamed top to bottom, so column widths must be set before the first row.
         self._adjust_column_widths(worksheet)
-    
-    def _add_month_title(self, worksheet, year: int, month: int):
-        """Add month title to worksheet."""
-        month_name = f"{calendar.month_name[month]} {year}"
-        worksheet.merge_cells('A1:H1')
-        worksheet['A1'] = month_name
-        worksheet['A1'].font = Font(size=16, bold=True)
-        worksheet['A1'].alignment = Alignment(horizontal='center')
+        self._add_month_title(worksheet, month_title)
+        self._add_day_headers(worksheet)
+        self._fill_calendar_days(worksheet, calendar_weeks, month_data)
+        self._add_monthly_totals(worksheet, month_data, len(calendar_weeks))
+    
+    def _add_month_title(self, worksheet, month_title: str):
+        """Add month title and a spacer row to worksheet."""
+        title_cell = WriteOnlyCell(worksheet, value=month_title)
+        title_cell.font = _TITLE_FONT
+        title_cell.alignment = _CENTER_ALIGN
+        worksheet.merged_cells.add('A1:H1')
+        worksheet.append([title_cell])
+        worksheet.append([])
     
     def _add_day_headers(self, worksheet):
         """Add day of week headers."""
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        thin_border = self._create_thin_border()
-        
-        for i, day_name in enumerate(day_names):
-            cell = worksheet.cell(row=3, column=i+1, value=day_name)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
-            cell.border = thin_border
-    
-    def _fill_calendar_days(self, worksheet, year: int, month: int, month_data: dict):
-        """Fill calendar with days and work hours data."""
-        calendar_weeks = calendar.monthcalendar(year, month)
-        
-        for week_number, week in enumerate(calendar_weeks):
-            for day_number, day in enumerate(week):
-                if day != 0:
-                    self._add_day_cell(worksheet, week_number, day_number, day, year, month, month_data)
-    
-    def _add_day_cell(self, worksheet, week_number: int, day_number: int, day: int, year: int, month: int, month_data: dict):
-        """Add individual day cell with work hours if available."""
-        row = 4 + week_number
-        column = day_number + 1
-        date_string = f"{year}-{month:02d}-{day:02d}"
-        
-        worksheet.cell(row=row, column=column, value=day).font = Font(bold=True)
-        
-        if date_string in month_data:
-            self._add_work_hours_to_cell(worksheet, row, column, month_data[date_string])
-        
-        self._apply_cell_formatting(worksheet, row, column, day_number >= 5)
-    
-    def _add_work_hours_to_cell(self, worksheet, row: int, column: int, day_data: dict):
-        """Add work hours information to day cell."""
-        worksheet.cell(row=row+1, column=column, value=f"W: {day_data['worked_hours']}")
-        
-        if day_data['extra_hours'] != "00:00":
-            extra_cell = worksheet.cell(row=row+2, column=column, value=f"E: {day_data['extra_hours']}")
-            extra_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
-            extra_cell.fill = extra_fill
-    
-    def _apply_cell_formatting(self, worksheet, row: int, column: int, is_weekend: bool):
-        """Apply background color and border formatting to cells."""
-        weekend_fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
-        workday_fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-        thin_border = self._create_thin_border()
-        
-        fill_color = weekend_fill if is_weekend else workday_fill
         
-        for cell_row in range(row, row + 3):
-            cell = worksheet.cell(row=cell_row, column=column)
-            cell.fill = fill_color
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal='center')
+        header_row = []
+        for day_name in day_names:
+            cell = WriteOnlyCell(worksheet, value=day_name)
+            cell.fill = _HEADER_FILL
+            cell.font = _HEADER_FONT
+            cell.alignment = _CENTER_ALIGN
+            cell.border = _THIN_BORDER
+            header_row.append(cell)
+        worksheet.append(header_row)
+    
+    def _fill_calendar_days(self, worksheet, calendar_weeks: List[List[int]], month_data: dict):
+        """Fill calendar with days and work hours data."""
+        # Each week takes three rows: day number, worked hours and extra hours.
+        for week in calendar_weeks:
+            for row in self._create_week_block(worksheet, week, month_data):
+                worksheet.append(row)
+    
+    def _create_week_block(self, worksheet, week: List[int], month_data: dict) -> List[List[Optional[WriteOnlyCell]]]:
+        """Create a week's 3x7 block of day, worked and extra cells, padded with None outside the month."""
+        day_row = [None] * 7
+        worked_row = [None] * 7
+        extra_row = [None] * 7
+        
+        for index, day in enumerate(week):
+            if day == 0:
+                continue
+            
+            column = index + 1
+            day_data = month_data.get(day)
+            
+            day_row[index] = self._create_calendar_cell(worksheet, column, day)
+            day_row[index].font = _BOLD_FONT
+            worked_row[index] = self._create_calendar_cell(worksheet, column)
+            extra_row[index] = self._create_calendar_cell(worksheet, column)
+            
+            if day_data:
+                worked_row[index].value = f"W: {day_data['worked_hours']}"
+                if day_data['has_extra']:
+                    extra_row[index].value = f"E: {day_data['extra_hours']}"
+                    extra_row[index].fill = _EXTRA_FILL
+        
+        return [day_row, worked_row, extra_row]
+    
+    def _create_calendar_cell(self, worksheet, column: int, value=None) -> WriteOnlyCell:
+        """Create a formatted calendar cell for the given column."""
+        cell = WriteOnlyCell(worksheet, value=value)
+        self._apply_cell_formatting(cell, column)
+        return cell
+    
+    def _apply_cell_formatting(self, cell: WriteOnlyCell, column: int):
+        """Apply background color and border formatting to a cell."""
+        cell.fill = _COL_FILL[column]
+        cell.border = _THIN_BORDER
+        cell.alignment = _CENTER_ALIGN
     
     def _add_monthly_totals(self, worksheet, month_data: dict, calendar_weeks_count: int):
-        """Add monthly totals row to worksheet."""
-        total_row = 4 + calendar_weeks_count + 1
+        """Add monthly totals row, after a spacer row, to worksheet."""
+        total_row = 4 + calendar_weeks_count * 3 + 1
         total_worked, total_extra = self._calculate_monthly_totals(month_data)
         
-        worksheet.merge_cells(f'A{total_row}:B{total_row}')
-        worksheet[f'A{total_row}'] = "MONTHLY TOTAL:"
-        worksheet[f'A{total_row}'].font = Font(bold=True)
+        label_cell = WriteOnlyCell(worksheet, value="MONTHLY TOTAL:")
+        label_cell.font = _BOLD_FONT
         
-        worked_cell = worksheet[f'C{total_row}']
-        worked_cell.value = f"Worked: {self._format_timedelta(total_worked)}"
-        worked_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
-        worked_cell.font = Font(bold=True)
+        worked_cell = WriteOnlyCell(worksheet, value=f"Worked: {self._format_timedelta(total_worked)}")
+        worked_cell.fill = _TOTAL_WORKED_FILL
+        worked_cell.font = _BOLD_FONT
         
-        extra_cell = worksheet[f'E{total_row}']
-        extra_cell.value = f"Extra: {self._format_timedelta(total_extra)}"
-        extra_cell.fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
-        extra_cell.font = Font(bold=True)
+        extra_cell = WriteOnlyCell(worksheet, value=f"Extra: {self._format_timedelta(total_extra)}")
+        extra_cell.fill = _TOTAL_EXTRA_FILL
+        extra_cell.font = _BOLD_FONT
+        
+        worksheet.merged_cells.add(f'A{total_row}:B{total_row}')
+        worksheet.append([])
+        worksheet.append([label_cell, None, worked_cell, None, extra_cell])
     
     def _calculate_monthly_totals(self, month_data: dict) -> Tuple[timedelta, timedelta]:
         """Calculate total worked and extra hours for the month."""
@@ -398,17 +523,8 @@ class MonthlyCalendarFormatter:
     
     def _adjust_column_widths(self, worksheet):
         """Adjust column widths for better readability."""
-        for column_number in range(1, 8):
-            worksheet.column_dimensions[chr(64 + column_number)].width = 15
-    
-    def _create_thin_border(self) -> Border:
-        """Create thin border style."""
-        return Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        for column_letter in _CALENDAR_COLUMN_LETTERS:
+            worksheet.column_dimensions[column_letter].width = 15
     
     def _parse_time_string(self, time_string: str) -> timedelta:
         """Convert time string HH:MM to timedelta."""
@@ -420,10 +536,7 @@ class MonthlyCalendarFormatter:
     
     def _format_timedelta(self, time_delta: timedelta) -> str:
         """Convert timedelta to readable HH:MM format."""
-        total_seconds = int(time_delta.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        return f"{hours:02d}:{minutes:02d}"
+        return _format_hours(time_delta)
 
 
 if __name__ == "__main__":